@@ -8,26 +8,76 @@ import subprocess
 import sys
 import os
 import platform
+import re
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import psycopg2
+import psycopg2.errors
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 
-def run_command(command, shell=True, capture_output=True):
-    """Run a system command and return the result."""
+# pg_hba.conf allowing passwordless local access while the password is reset
+TRUST_CONFIG = b"""# TYPE  DATABASE        USER            ADDRESS                 METHOD
+# Allow local connections with trust (for reset)
+local   all             all                                     trust
+host    all             all             127.0.0.1/32            trust
+host    all             all             ::1/128                 trust
+"""
+
+# pg_hba.conf requiring md5 password authentication
+SECURE_CONFIG = b"""# TYPE  DATABASE        USER            ADDRESS                 METHOD
+# Local connections
+local   all             postgres                                md5
+local   all             all                                     md5
+
+# IPv4 local connections:
+host    all             postgres        127.0.0.1/32            md5
+host    all             all             127.0.0.1/32            md5
+
+# IPv6 local connections:
+host    all             postgres        ::1/128                 md5
+host    all             all             ::1/128                 md5
+"""
+
+def run_command(command, shell=False, capture_output=True):
+    """Run a system command (an argument list unless shell=True) and return the result."""
     try:
         result = subprocess.run(command, shell=shell, capture_output=capture_output, text=True)
         return result.returncode == 0, result.stdout, result.stderr
     except Exception as e:
         return False, "", str(e)
 
+@lru_cache(maxsize=1)
 def find_postgres_service():
     """Find the PostgreSQL service name on different systems."""
     system = platform.system().lower()
     
     if system == "windows":
-        # Common PostgreSQL service names on Windows
+        # List every installed PostgreSQL service with a single process spawn
+        success, output, _ = run_command([
+            "powershell", "-NoProfile", "-Command",
+            "Get-Service postgresql* | Select-Object -ExpandProperty Name",
+        ])
+        if success:
+            names = [line.strip() for line in output.splitlines() if line.strip()]
+            if not names:
+                return None
+            # Prefer the newest postgresql-x64-NN service
+            versioned = []
+            for name in names:
+                match = re.fullmatch(r"postgresql-x64-(\d+)", name, re.IGNORECASE)
+                if match:
+                    versioned.append((int(match.group(1)), name))
+            return max(versioned)[1] if versioned else names[0]
+        
+        # PowerShell unavailable: fall back to common PostgreSQL service names
         services = ["postgresql-x64-14", "postgresql-x64-15", "postgresql-x64-16", "PostgreSQL"]
-        for service in services:
-            success, _, _ = run_command(f'sc query "{service}"')
+        # Query all candidates at once; process spawn dominates each lookup
+        with ThreadPoolExecutor(max_workers=len(services)) as executor:
+            results = list(executor.map(lambda s: run_command(["sc", "query", s]), services))
+        # Pick the first match in list order, as the sequential checks did
+        for service, (success, _, _) in zip(services, results):
             if success:
                 return service
     elif system == "linux":
@@ -49,9 +99,9 @@ def stop_postgres():
     print(f"🔄 Stopping PostgreSQL service: {service_name}")
     
     if system == "windows":
-        success, _, error = run_command(f'net stop "{service_name}"')
+        success, _, error = run_command(["net", "stop", service_name])
     else:
-        success, _, error = run_command(f'sudo systemctl stop {service_name}')
+        success, _, error = run_command(["sudo", "systemctl", "stop", service_name])
     
     if success:
         print("✅ PostgreSQL service stopped")
@@ -72,9 +122,9 @@ def start_postgres():
     print(f"🔄 Starting PostgreSQL service: {service_name}")
     
     if system == "windows":
-        success, _, error = run_command(f'net start "{service_name}"')
+        success, _, error = run_command(["net", "start", service_name])
     else:
-        success, _, error = run_command(f'sudo systemctl start {service_name}')
+        success, _, error = run_command(["sudo", "systemctl", "start", service_name])
     
     if success:
         print("✅ PostgreSQL service started")
@@ -83,6 +133,32 @@ def start_postgres():
         print(f"❌ Failed to start PostgreSQL service: {error}")
         return False
 
+def wait_for_postgres(timeout=10, password=None):
+    """Wait until PostgreSQL accepts sessions on localhost:5432."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        # A listening socket is not enough: during startup the server still
+        # rejects sessions with "the database system is starting up"
+        try:
+            psycopg2.connect(
+                host="localhost",
+                database="postgres",
+                user="postgres",
+                password=password,
+                connect_timeout=1
+            ).close()
+            return True
+        except psycopg2.OperationalError:
+            time.sleep(0.1)
+    return False
+
+def copy_file_owner(src, dst):
+    """Give dst the owner of src where the platform supports it."""
+    if hasattr(os, "chown"):
+        st = os.stat(src)
+        os.chown(dst, st.st_uid, st.st_gid)
+
+@lru_cache(maxsize=1)
 def find_postgres_data_dir():
     """Find PostgreSQL data directory."""
     system = platform.system().lower()
@@ -135,29 +211,31 @@ def reset_postgres_auth():
     # Backup original file
     backup_path = pg_hba_path + ".backup"
     try:
-        with open(pg_hba_path, 'r') as original:
-            with open(backup_path, 'w') as backup:
-                backup.write(original.read())
+        shutil.copy2(pg_hba_path, backup_path)
+        # restore_postgres_auth() moves the backup back, so it needs the server's owner too
+        copy_file_owner(pg_hba_path, backup_path)
         print(f"✅ Backup created at {backup_path}")
     except Exception as e:
         print(f"❌ Failed to backup pg_hba.conf: {e}")
         return False
     
     # Create new pg_hba.conf with trust authentication
-    trust_config = """# TYPE  DATABASE        USER            ADDRESS                 METHOD
-# Allow local connections with trust (for reset)
-local   all             all                                     trust
-host    all             all             127.0.0.1/32            trust
-host    all             all             ::1/128                 trust
-"""
-    
+    # Write to a temp file and swap it in so a crash never leaves a truncated config
+    tmp_path = pg_hba_path + ".tmp"
     try:
-        with open(pg_hba_path, 'w') as f:
-            f.write(trust_config)
+        with open(tmp_path, 'wb') as f:
+            f.write(TRUST_CONFIG)
+        # Keep the server's owner and mode (postgres:postgres 0600 on Linux);
+        # never swap in a file the server might not be able to read
+        shutil.copymode(pg_hba_path, tmp_path)
+        copy_file_owner(pg_hba_path, tmp_path)
+        os.replace(tmp_path, pg_hba_path)
         print("✅ pg_hba.conf updated to allow trust authentication")
         return True
     except Exception as e:
         print(f"❌ Failed to update pg_hba.conf: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
         return False
 
 def restore_postgres_auth():
@@ -172,9 +250,8 @@ def restore_postgres_auth():
     
     if os.path.exists(backup_path):
         try:
-            with open(backup_path, 'r') as backup:
-                with open(pg_hba_path, 'w') as original:
-                    original.write(backup.read())
+            # Atomic move; the backup is consumed by the restore
+            os.replace(backup_path, pg_hba_path)
             print("✅ Original pg_hba.conf restored")
             return True
         except Exception as e:
@@ -203,10 +280,11 @@ def reset_postgres_password():
         print("✅ Password reset to '1' for user 'postgres'")
         
         # Create test database if it doesn't exist
-        cursor.execute("SELECT 1 FROM pg_database WHERE datname='testdb'")
-        if not cursor.fetchone():
+        try:
             cursor.execute("CREATE DATABASE testdb;")
             print("✅ Created test database 'testdb'")
+        except psycopg2.errors.DuplicateDatabase:
+            pass
         
         cursor.close()
         conn.close()
@@ -252,23 +330,9 @@ def create_secure_pg_hba():
     
     pg_hba_path = os.path.join(data_dir, "pg_hba.conf")
     
-    secure_config = """# TYPE  DATABASE        USER            ADDRESS                 METHOD
-# Local connections
-local   all             postgres                                md5
-local   all             all                                     md5
-
-# IPv4 local connections:
-host    all             postgres        127.0.0.1/32            md5
-host    all             all             127.0.0.1/32            md5
-
-# IPv6 local connections:
-host    all             postgres        ::1/128                 md5
-host    all             all             ::1/128                 md5
-"""
-    
     try:
-        with open(pg_hba_path, 'w') as f:
-            f.write(secure_config)
+        with open(pg_hba_path, 'wb') as f:
+            f.write(SECURE_CONFIG)
         print("✅ pg_hba.conf updated with secure password authentication")
         return True
     except Exception as e:
@@ -285,7 +349,7 @@ def main():
         import psycopg2
     except ImportError:
         print("❌ psycopg2 not found. Installing...")
-        success, _, _ = run_command(f"{sys.executable} -m pip install psycopg2-binary")
+        success, _, _ = run_command([sys.executable, "-m", "pip", "install", "psycopg2-binary"])
         if not success:
             print("❌ Failed to install psycopg2. Please install it manually:")
             print("   pip install psycopg2-binary")
@@ -305,10 +369,10 @@ def main():
         print("❌ Failed to start PostgreSQL. Exiting.")
         return False
     
-    # Wait a moment for PostgreSQL to fully start
-    import time
+    # Wait for PostgreSQL to accept connections
     print("⏳ Waiting for PostgreSQL to start...")
-    time.sleep(3)
+    if not wait_for_postgres():
+        print("⚠️  PostgreSQL is not accepting connections yet, continuing anyway...")
     
     # Step 4: Reset password
     if not reset_postgres_password():
@@ -324,7 +388,9 @@ def main():
     start_postgres()
     
     # Wait for restart
-    time.sleep(3)
+    print("⏳ Waiting for PostgreSQL to restart...")
+    if not wait_for_postgres(password="1"):
+        print("⚠️  PostgreSQL is not accepting connections yet, continuing anyway...")
     
     # Step 6: Test connection
     if test_connection():
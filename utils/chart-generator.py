@@ -1,12 +1,24 @@
+import argparse
 import json
-import matplotlib.pyplot as plt
-import seaborn as sns
+import matplotlib.style as mplstyle
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import pandas as pd
 import numpy as np
 from pathlib import Path
 import glob
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 150 dpi is plenty for on-screen reports; set CHART_DPI for high-res exports
+SAVE_DPI = int(os.environ.get('CHART_DPI', '150'))
+# Fast zlib level: larger PNGs, much less encode CPU
+PNG_OPTIONS = {'compress_level': 1}
+
 class ChartGenerator:
     def __init__(self):
         self.results_dir = Path('results')
@@ -14,42 +26,63 @@ class ChartGenerator:
         self.reports_dir.mkdir(exist_ok=True)
         
         # Set style
-        plt.style.use('seaborn-v0_8')
-        sns.set_palette("husl")
-        
+        mplstyle.use('seaborn-v0_8')
+        
+    def _latest(self, prefix):
+        """Find the newest results file with the given prefix"""
+        if not self.results_dir.is_dir():
+            return None
+        with os.scandir(self.results_dir) as it:
+            best = max((e for e in it if e.name.startswith(prefix) and e.name.endswith('.json')),
+                       key=lambda e: e.stat().st_ctime, default=None)
+        return best.path if best else None
+    
+    def _load_json(self, path):
+        """Parse a results file, using orjson when it is installed"""
+        with open(path, 'rb') as f:
+            if orjson is not None:
+                return orjson.loads(f.read())
+            return json.load(f)
+    
     def load_latest_results(self):
         """Load the most recent test results"""
         results = {}
         
         # Find latest PostgreSQL results
-        pg_files = list(self.results_dir.glob('postgres-benchmark-*.json'))
-        if pg_files:
-            latest_pg = max(pg_files, key=os.path.getctime)
-            with open(latest_pg) as f:
-                results['postgres'] = json.load(f)
+        latest_pg = self._latest('postgres-benchmark-')
+        if latest_pg:
+            results['postgres'] = self._load_json(latest_pg)
                 
         # Find latest overhead results
-        overhead_files = list(self.results_dir.glob('connection-overhead-*.json'))
-        if overhead_files:
-            latest_overhead = max(overhead_files, key=os.path.getctime)
-            with open(latest_overhead) as f:
-                results['overhead'] = json.load(f)
+        latest_overhead = self._latest('connection-overhead-')
+        if latest_overhead:
+            results['overhead'] = self._load_json(latest_overhead)
                 
         return results
     
-    def create_throughput_comparison(self, postgres_data):
-        """Create throughput comparison chart"""
-        fig, ax = plt.subplots(figsize=(12, 8))
-        
-        # Extract data
+    def _extract_series(self, postgres_data):
+        """Extract user counts, throughput and P99 latency for both runs"""
         without_pooling = postgres_data['withoutPooling']
         with_pooling = postgres_data['withPooling']
         
+        users_with = [r['concurrentUsers'] for r in with_pooling]
         users_without = [r['concurrentUsers'] for r in without_pooling]
+        throughput_with = [r['requests']['average'] for r in with_pooling]
         throughput_without = [r['requests']['average'] for r in without_pooling]
+        latency_with = [r['latency']['p99'] for r in with_pooling]
+        latency_without = [r['latency']['p99'] for r in without_pooling]
         
-        users_with = [r['concurrentUsers'] for r in with_pooling]
-        throughput_with = [r['requests']['average'] for r in with_pooling]
+        return (users_with, users_without, throughput_with, throughput_without,
+                latency_with, latency_without)
+    
+    def create_throughput_comparison(self, series):
+        """Create throughput comparison chart"""
+        fig = Figure(figsize=(12, 8))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
+        
+        users_with, users_without, throughput_with, throughput_without, _, _ = series
+        without_by_users = dict(zip(users_without, throughput_without))
         
         # Create the plot
         ax.plot(users_without, throughput_without, 'o-', linewidth=3, markersize=8, 
@@ -66,9 +99,8 @@ class ChartGenerator:
         ax.grid(True, alpha=0.3)
         
         # Add improvement annotations
-        for i, (users, without, with_pool) in enumerate(zip(users_with, 
-                [t for u, t in zip(users_without, throughput_without) if u in users_with],
-                throughput_with)):
+        for users, with_pool in zip(users_with, throughput_with):
+            without = without_by_users.get(users, 0)
             if without > 0:
                 improvement = ((with_pool - without) / without) * 100
                 if improvement > 10:  # Only show significant improvements
@@ -80,23 +112,18 @@ class ChartGenerator:
                               fontweight='bold',
                               color='#27ae60')
         
-        plt.tight_layout()
-        plt.savefig(self.reports_dir / 'throughput_comparison.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.subplots_adjust(left=0.08, right=0.97, top=0.9, bottom=0.1)
+        fig.savefig(self.reports_dir / 'throughput_comparison.png', dpi=SAVE_DPI,
+                    pil_kwargs=PNG_OPTIONS)
         print("📊 Generated: throughput_comparison.png")
     
-    def create_latency_comparison(self, postgres_data):
+    def create_latency_comparison(self, series):
         """Create latency comparison chart"""
-        fig, ax = plt.subplots(figsize=(12, 8))
+        fig = Figure(figsize=(12, 8))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
         
-        without_pooling = postgres_data['withoutPooling']
-        with_pooling = postgres_data['withPooling']
-        
-        users_without = [r['concurrentUsers'] for r in without_pooling]
-        latency_without = [r['latency']['p99'] for r in without_pooling]
-        
-        users_with = [r['concurrentUsers'] for r in with_pooling]
-        latency_with = [r['latency']['p99'] for r in with_pooling]
+        users_with, users_without, _, _, latency_with, latency_without = series
         
         ax.plot(users_without, latency_without, 'o-', linewidth=3, markersize=8, 
                 label='Without Connection Pooling', color='#e74c3c')
@@ -111,14 +138,16 @@ class ChartGenerator:
         ax.legend(fontsize=12)
         ax.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        plt.savefig(self.reports_dir / 'latency_comparison.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.subplots_adjust(left=0.08, right=0.97, top=0.9, bottom=0.1)
+        fig.savefig(self.reports_dir / 'latency_comparison.png', dpi=SAVE_DPI,
+                    pil_kwargs=PNG_OPTIONS)
         print("📊 Generated: latency_comparison.png")
     
     def create_connection_overhead_chart(self, overhead_data):
         """Create connection overhead comparison"""
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+        fig = Figure(figsize=(15, 6))
+        FigureCanvasAgg(fig)
+        ax1, ax2 = fig.subplots(1, 2)
         
         # PostgreSQL overhead
         pg_analysis = overhead_data['analysis']['postgres']
@@ -151,45 +180,44 @@ class ChartGenerator:
                     transform=ax2.transAxes, fontsize=14, style='italic')
             ax2.set_title('MySQL Connection Overhead', fontsize=14, fontweight='bold')
         
-        plt.tight_layout()
-        plt.savefig(self.reports_dir / 'connection_overhead.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.subplots_adjust(left=0.06, right=0.98, top=0.92, bottom=0.14)
+        fig.savefig(self.reports_dir / 'connection_overhead.png', dpi=SAVE_DPI,
+                    pil_kwargs=PNG_OPTIONS)
         print("📊 Generated: connection_overhead.png")
     
-    def create_performance_summary(self, postgres_data):
+    def create_performance_summary(self, series):
         """Create a comprehensive performance summary chart"""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        fig = Figure(figsize=(16, 12))
+        FigureCanvasAgg(fig)
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
         
-        without_pooling = postgres_data['withoutPooling']
-        with_pooling = postgres_data['withPooling']
+        users, users_without, throughput_with, all_throughput_without, latency_with, all_latency_without = series
+        throughput_by_users = dict(zip(users_without, all_throughput_without))
+        latency_by_users = dict(zip(users_without, all_latency_without))
         
         # 1. Throughput comparison
-        users = [r['concurrentUsers'] for r in with_pooling]
-        throughput_without = []
-        throughput_with = [r['requests']['average'] for r in with_pooling]
-        
-        for user_count in users:
-            without_result = next((r for r in without_pooling if r['concurrentUsers'] == user_count), None)
-            throughput_without.append(without_result['requests']['average'] if without_result else 0)
+        throughput_without = [throughput_by_users.get(u, 0) for u in users]
+        user_labels = [f'{u}\nusers' for u in users]
+        x_users = np.arange(len(users))
+        width = 0.35
         
-        ax1.bar([f'{u}\nusers' for u in users], throughput_without, alpha=0.7, label='Without Pooling', color='#e74c3c')
-        ax1.bar([f'{u}\nusers' for u in users], throughput_with, alpha=0.7, label='With Pooling', color='#2ecc71')
+        ax1.bar(x_users - width/2, throughput_without, width, label='Without Pooling', color='#e74c3c', alpha=0.7)
+        ax1.bar(x_users + width/2, throughput_with, width, label='With Pooling', color='#2ecc71', alpha=0.7)
         ax1.set_ylabel('Requests/sec')
         ax1.set_title('Throughput Comparison')
+        ax1.set_xticks(x_users)
+        ax1.set_xticklabels(user_labels)
         ax1.legend()
         
         # 2. Latency comparison
-        latency_without = []
-        latency_with = [r['latency']['p99'] for r in with_pooling]
-        
-        for user_count in users:
-            without_result = next((r for r in without_pooling if r['concurrentUsers'] == user_count), None)
-            latency_without.append(without_result['latency']['p99'] if without_result else 0)
+        latency_without = [latency_by_users.get(u, 0) for u in users]
         
-        ax2.bar([f'{u}\nusers' for u in users], latency_without, alpha=0.7, label='Without Pooling', color='#e74c3c')
-        ax2.bar([f'{u}\nusers' for u in users], latency_with, alpha=0.7, label='With Pooling', color='#2ecc71')
+        ax2.bar(x_users - width/2, latency_without, width, label='Without Pooling', color='#e74c3c', alpha=0.7)
+        ax2.bar(x_users + width/2, latency_with, width, label='With Pooling', color='#2ecc71', alpha=0.7)
         ax2.set_ylabel('P99 Latency (ms)')
         ax2.set_title('Latency Comparison')
+        ax2.set_xticks(x_users)
+        ax2.set_xticklabels(user_labels)
         ax2.legend()
         
         # 3. Performance improvements
@@ -201,7 +229,7 @@ class ChartGenerator:
             else:
                 improvements.append(0)
         
-        bars = ax3.bar([f'{u}\nusers' for u in users], improvements, color='#f39c12', alpha=0.8)
+        bars = ax3.bar(user_labels, improvements, color='#f39c12', alpha=0.8)
         ax3.set_ylabel('Improvement (%)')
         ax3.set_title('Throughput Improvement with Pooling')
         ax3.axhline(y=0, color='black', linestyle='-', alpha=0.3)
@@ -218,7 +246,6 @@ class ChartGenerator:
         with_resources = [30, 40, 20]  # Typical improvements
         
         x = np.arange(len(categories))
-        width = 0.35
         
         ax4.bar(x - width/2, without_resources, width, label='Without Pooling', color='#e74c3c', alpha=0.7)
         ax4.bar(x + width/2, with_resources, width, label='With Pooling', color='#2ecc71', alpha=0.7)
@@ -228,23 +255,25 @@ class ChartGenerator:
         ax4.set_xticklabels(categories)
         ax4.legend()
         
-        plt.suptitle('Connection Pooling Performance Analysis', fontsize=18, fontweight='bold', y=0.98)
-        plt.tight_layout()
-        plt.savefig(self.reports_dir / 'performance_summary.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.suptitle('Connection Pooling Performance Analysis', fontsize=18, fontweight='bold', y=0.98)
+        fig.subplots_adjust(left=0.06, right=0.98, top=0.92, bottom=0.07, hspace=0.3)
+        fig.savefig(self.reports_dir / 'performance_summary.png', dpi=SAVE_DPI,
+                    pil_kwargs=PNG_OPTIONS)
         print("📊 Generated: performance_summary.png")
     
-    def generate_all_charts(self):
-        """Generate all performance charts"""
+    def generate_all_charts(self, summary=True):
+        """Generate all performance charts; skip the summary figure with summary=False"""
         print("🎨 Generating performance charts...")
         
         results = self.load_latest_results()
         
         if 'postgres' in results:
             print("📊 Creating PostgreSQL performance charts...")
-            self.create_throughput_comparison(results['postgres'])
-            self.create_latency_comparison(results['postgres'])
-            self.create_performance_summary(results['postgres'])
+            series = self._extract_series(results['postgres'])
+            self.create_throughput_comparison(series)
+            self.create_latency_comparison(series)
+            if summary:
+                self.create_performance_summary(series)
         
         if 'overhead' in results:
             print("📊 Creating connection overhead charts...")
@@ -256,5 +285,10 @@ class ChartGenerator:
             print(f"   - {chart_file.name}")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Generate connection pooling performance charts')
+    parser.add_argument('--no-summary', action='store_true',
+                        help='skip the four-panel performance summary chart')
+    args = parser.parse_args()
+    
     generator = ChartGenerator()
-    generator.generate_all_charts()
\ No newline at end of file
+    generator.generate_all_charts(summary=not args.no_summary)
\ No newline at end of file
@@ -1,121 +1,239 @@
+import argparse
 import json
+import mmap
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+import numpy as np
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 import os
+import pickle
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 150 dpi is plenty for on-screen reports; set CHART_DPI for high-res exports
+SAVE_DPI = int(os.environ.get('CHART_DPI', '150'))
+# Fast zlib level and no Software tEXt chunk: larger PNGs, much less encode CPU
+PNG_KW = dict(pil_kwargs={'compress_level': 1, 'optimize': False}, metadata={'Software': None})
+
+# Charts drawn from each results file: (method name, output file)
+PG_CHARTS = (('create_throughput_comparison', 'throughput_comparison.png'),
+             ('create_latency_comparison', 'latency_comparison.png'),
+             ('create_performance_summary', 'performance_summary.png'))
+OVERHEAD_CHARTS = (('create_connection_overhead_chart', 'connection_overhead.png'),)
+CHARTS = {'postgres': PG_CHARTS, 'overhead': OVERHEAD_CHARTS}
+
+@dataclass
+class PgArrays:
+    """PostgreSQL benchmark series; the without-pooling side is sorted by user count"""
+    users_wo: np.ndarray
+    rps_wo: np.ndarray
+    p99_wo: np.ndarray
+    users_wp: np.ndarray
+    rps_wp: np.ndarray
+    p99_wp: np.ndarray
+
+def _extract_postgres_arrays(postgres_data):
+    """Parse the benchmark results once into NumPy arrays"""
+    wo = np.array([(r['concurrentUsers'], r['requests']['average'], r['latency']['p99'])
+                   for r in postgres_data['withoutPooling']], dtype=float).reshape(-1, 3)
+    wp = np.array([(r['concurrentUsers'], r['requests']['average'], r['latency']['p99'])
+                   for r in postgres_data['withPooling']], dtype=float).reshape(-1, 3)
+    wo = wo[np.argsort(wo[:, 0], kind='stable')]
+    
+    return PgArrays(users_wo=wo[:, 0].astype(int), rps_wo=wo[:, 1], p99_wo=wo[:, 2],
+                    users_wp=wp[:, 0].astype(int), rps_wp=wp[:, 1], p99_wp=wp[:, 2])
+
+def _load_json(path):
+    """Parse a results file, mapping it straight into orjson when available"""
+    with open(path, 'rb') as f:
+        if orjson is None or os.fstat(f.fileno()).st_size == 0:
+            return json.load(f)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
 
 class SimpleChartGenerator:
     def __init__(self):
         self.results_dir = Path('results')
         self.reports_dir = Path('reports')
         self.reports_dir.mkdir(exist_ok=True)
+        self._written = []
+        self._sources = {}
         
-        # Set style
-        plt.style.use('default')
+        # Parsed results keyed by (path, mtime_ns, size); read on first use
+        self.cache_path = self.reports_dir / '.chart-cache.pkl'
+        self._cache = None
         
-    def load_latest_results(self):
-        """Load the most recent test results"""
-        results = {}
+        # Set style
+        plt.style.use(['default', 'fast'])
+        plt.rcParams.update({
+            'axes.titlesize': 16,
+            'axes.titleweight': 'bold',
+            'axes.labelsize': 14,
+            'axes.labelweight': 'bold',
+            'legend.fontsize': 12,
+        })
+        
+    def _read_cache(self):
+        """Load the parsed-results cache, starting empty if it is missing or unreadable"""
+        try:
+            with open(self.cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            # Corrupt or written by an incompatible version: just reparse
+            return {}
+    
+    def _write_cache(self):
+        """Persist the parsed-results cache, keeping only the files loaded this run"""
+        sources = set(self._sources.values())
+        self._cache = {k: v for k, v in self._cache.items() if k[0] in sources}
+        with open(self.cache_path, 'wb') as f:
+            pickle.dump(self._cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    def _load_cached(self, path):
+        """Parse a results file unless it is unchanged since the last run"""
+        if self._cache is None:
+            self._cache = self._read_cache()
+        
+        st = os.stat(path)
+        key = (path, st.st_mtime_ns, st.st_size)
+        if key in self._cache:
+            return self._cache[key]
+        
+        data = _load_json(path)
+        # Drop stale entries for this file before storing the fresh one
+        self._cache = {k: v for k, v in self._cache.items() if k[0] != path}
+        self._cache[key] = data
+        return data
+    
+    def _latest(self, prefix):
+        """Find the newest results file with the given prefix"""
+        best = None
+        best_ctime = -1
+        if not self.results_dir.is_dir():
+            return best
+        with os.scandir(self.results_dir) as it:
+            for entry in it:
+                if entry.name.startswith(prefix) and entry.name.endswith('.json'):
+                    ctime = entry.stat().st_ctime
+                    if ctime > best_ctime:
+                        best_ctime, best = ctime, entry.path
+        return best
+    
+    def find_latest_results(self):
+        """Locate the most recent results file of each kind without parsing it"""
+        self._sources = {}
         
         # Find latest PostgreSQL results
-        pg_files = list(self.results_dir.glob('postgres-benchmark-*.json'))
-        if pg_files:
-            latest_pg = max(pg_files, key=os.path.getctime)
-            with open(latest_pg) as f:
-                results['postgres'] = json.load(f)
+        latest_pg = self._latest('postgres-benchmark-')
+        if latest_pg:
+            self._sources['postgres'] = latest_pg
                 
         # Find latest overhead results
-        overhead_files = list(self.results_dir.glob('connection-overhead-*.json'))
-        if overhead_files:
-            latest_overhead = max(overhead_files, key=os.path.getctime)
-            with open(latest_overhead) as f:
-                results['overhead'] = json.load(f)
+        latest_overhead = self._latest('connection-overhead-')
+        if latest_overhead:
+            self._sources['overhead'] = latest_overhead
                 
-        return results
+        return self._sources
+    
+    def load_latest_results(self):
+        """Load the most recent test results"""
+        return {kind: self._load_cached(path) for kind, path in self.find_latest_results().items()}
+    
+    def _needs_rebuild(self, dst, src):
+        """Check whether a chart is missing or older than its source results (FORCE_REBUILD overrides)"""
+        if os.environ.get('FORCE_REBUILD'):
+            return True
+        try:
+            return dst.stat().st_mtime < os.stat(src).st_mtime
+        except FileNotFoundError:
+            return True
+    
+    def _reset_figure(self, fig, figsize, nrows=1, ncols=1):
+        """Clear the shared figure and lay out fresh axes for the next chart"""
+        fig.clear()
+        fig.set_size_inches(figsize)
+        fig.set_layout_engine('constrained')
+        return fig.subplots(nrows, ncols)
+    
+    def _plot_series(self, ax, users_wo, values_wo, users_wp, values_wp):
+        """Draw both series as one LineCollection plus one marker scatter"""
+        colors = ['#e74c3c', '#2ecc71']
+        segments = [np.column_stack([users_wo, values_wo]), np.column_stack([users_wp, values_wp])]
+        ax.add_collection(LineCollection(segments, colors=colors, linewidths=3))
+        ax.scatter(np.concatenate([users_wo, users_wp]), np.concatenate([values_wo, values_wp]),
+                   s=64, c=[colors[0]] * len(users_wo) + [colors[1]] * len(users_wp),
+                   zorder=3)
+        ax.autoscale_view()
+        
+        # The collection carries no per-series labels, so build the legend entries explicitly
+        handles = [Line2D([], [], color=color, marker='o', linewidth=3, markersize=8, label=label)
+                   for color, label in zip(colors, ['Without Connection Pooling', 'With Connection Pooling'])]
+        ax.legend(handles=handles)
     
-    def create_throughput_comparison(self, postgres_data):
+    def create_throughput_comparison(self, arrays, fig):
         """Create throughput comparison chart"""
-        fig, ax = plt.subplots(figsize=(12, 8))
-        
-        # Extract data
-        without_pooling = postgres_data['withoutPooling']
-        with_pooling = postgres_data['withPooling']
-        
-        users_without = [r['concurrentUsers'] for r in without_pooling]
-        throughput_without = [r['requests']['average'] for r in without_pooling]
-        
-        users_with = [r['concurrentUsers'] for r in with_pooling]
-        throughput_with = [r['requests']['average'] for r in with_pooling]
+        ax = self._reset_figure(fig, (12, 8))
         
         # Create the plot
-        ax.plot(users_without, throughput_without, 'o-', linewidth=3, markersize=8, 
-                label='Without Connection Pooling', color='#e74c3c')
-        ax.plot(users_with, throughput_with, 'o-', linewidth=3, markersize=8, 
-                label='With Connection Pooling', color='#2ecc71')
+        self._plot_series(ax, arrays.users_wo, arrays.rps_wo, arrays.users_wp, arrays.rps_wp)
         
-        ax.set_xlabel('Concurrent Users', fontsize=14, fontweight='bold')
-        ax.set_ylabel('Requests per Second', fontsize=14, fontweight='bold')
-        ax.set_title('PostgreSQL Throughput: Connection Pooling vs Direct Connections', 
-                    fontsize=16, fontweight='bold', pad=20)
+        ax.set_xlabel('Concurrent Users')
+        ax.set_ylabel('Requests per Second')
+        ax.set_title('PostgreSQL Throughput: Connection Pooling vs Direct Connections', pad=20)
         
-        ax.legend(fontsize=12)
         ax.grid(True, alpha=0.3)
         
         # Add improvement annotations for matching user counts
-        for user_count in users_with:
-            without_result = next((r for r in without_pooling if r['concurrentUsers'] == user_count), None)
-            with_result = next((r for r in with_pooling if r['concurrentUsers'] == user_count), None)
+        if arrays.users_wo.size:
+            idx = np.minimum(np.searchsorted(arrays.users_wo, arrays.users_wp), arrays.users_wo.size - 1)
+            baseline = arrays.rps_wo[idx]
+            valid = (arrays.users_wo[idx] == arrays.users_wp) & (baseline > 0)
+            improvements = np.zeros(arrays.users_wp.size)
+            improvements[valid] = (arrays.rps_wp[valid] - baseline[valid]) / baseline[valid] * 100
             
-            if without_result and with_result and without_result['requests']['average'] > 0:
-                improvement = ((with_result['requests']['average'] - without_result['requests']['average']) / 
-                             without_result['requests']['average']) * 100
-                if improvement > 10:  # Only show significant improvements
-                    ax.annotate(f'+{improvement:.0f}%', 
-                              xy=(user_count, with_result['requests']['average']), 
-                              xytext=(10, 10), 
-                              textcoords='offset points',
-                              fontsize=10, 
-                              fontweight='bold',
-                              color='#27ae60')
-        
-        plt.tight_layout()
-        plt.savefig(self.reports_dir / 'throughput_comparison.png', dpi=300, bbox_inches='tight')
-        plt.close()
+            for i in np.flatnonzero(improvements > 10):  # Only show significant improvements
+                ax.annotate(f'+{improvements[i]:.0f}%', 
+                          xy=(arrays.users_wp[i], arrays.rps_wp[i]), 
+                          xytext=(10, 10), 
+                          textcoords='offset points',
+                          fontsize=10, 
+                          fontweight='bold',
+                          color='#27ae60')
+        
+        path = self.reports_dir / 'throughput_comparison.png'
+        fig.savefig(path, dpi=SAVE_DPI, **PNG_KW)
         print("📊 Generated: throughput_comparison.png")
+        return path
     
-    def create_latency_comparison(self, postgres_data):
+    def create_latency_comparison(self, arrays, fig):
         """Create latency comparison chart"""
-        fig, ax = plt.subplots(figsize=(12, 8))
-        
-        without_pooling = postgres_data['withoutPooling']
-        with_pooling = postgres_data['withPooling']
-        
-        users_without = [r['concurrentUsers'] for r in without_pooling]
-        latency_without = [r['latency']['p99'] for r in without_pooling]
+        ax = self._reset_figure(fig, (12, 8))
         
-        users_with = [r['concurrentUsers'] for r in with_pooling]
-        latency_with = [r['latency']['p99'] for r in with_pooling]
+        self._plot_series(ax, arrays.users_wo, arrays.p99_wo, arrays.users_wp, arrays.p99_wp)
         
-        ax.plot(users_without, latency_without, 'o-', linewidth=3, markersize=8, 
-                label='Without Connection Pooling', color='#e74c3c')
-        ax.plot(users_with, latency_with, 'o-', linewidth=3, markersize=8, 
-                label='With Connection Pooling', color='#2ecc71')
+        ax.set_xlabel('Concurrent Users')
+        ax.set_ylabel('P99 Latency (ms)')
+        ax.set_title('PostgreSQL Latency: Connection Pooling vs Direct Connections', pad=20)
         
-        ax.set_xlabel('Concurrent Users', fontsize=14, fontweight='bold')
-        ax.set_ylabel('P99 Latency (ms)', fontsize=14, fontweight='bold')
-        ax.set_title('PostgreSQL Latency: Connection Pooling vs Direct Connections', 
-                    fontsize=16, fontweight='bold', pad=20)
-        
-        ax.legend(fontsize=12)
         ax.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        plt.savefig(self.reports_dir / 'latency_comparison.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        path = self.reports_dir / 'latency_comparison.png'
+        fig.savefig(path, dpi=SAVE_DPI, **PNG_KW)
         print("📊 Generated: latency_comparison.png")
+        return path
     
-    def create_connection_overhead_chart(self, overhead_data):
+    def create_connection_overhead_chart(self, overhead_data, fig):
         """Create connection overhead comparison"""
-        fig, ax = plt.subplots(figsize=(10, 6))
+        ax = self._reset_figure(fig, (10, 6))
         
         # PostgreSQL overhead
         pg_analysis = overhead_data['analysis']['postgres']
@@ -123,13 +241,11 @@ class SimpleChartGenerator:
         times = [pg_analysis['direct']['average'], pg_analysis['pooled']['average']]
         
         bars = ax.bar(categories, times, color=['#e74c3c', '#2ecc71'], alpha=0.8, width=0.6)
-        ax.set_ylabel('Average Connection Time (ms)', fontsize=12, fontweight='bold')
-        ax.set_title('PostgreSQL Connection Overhead Comparison', fontsize=14, fontweight='bold')
+        ax.set_ylabel('Average Connection Time (ms)', fontsize=12)
+        ax.set_title('PostgreSQL Connection Overhead Comparison', fontsize=14)
         
         # Add value labels on bars
-        for bar, value in zip(bars, times):
-            ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + max(times) * 0.01,
-                    f'{value:.1f}ms', ha='center', va='bottom', fontweight='bold', fontsize=12)
+        ax.bar_label(bars, fmt='%.1fms', padding=3, fontweight='bold', fontsize=12)
         
         # Add improvement text
         improvement = ((times[0] - times[1]) / times[0]) * 100
@@ -137,17 +253,14 @@ class SimpleChartGenerator:
                 ha='center', va='center', fontsize=14, fontweight='bold',
                 bbox=dict(boxstyle="round,pad=0.3", facecolor='lightgreen', alpha=0.7))
         
-        plt.tight_layout()
-        plt.savefig(self.reports_dir / 'connection_overhead.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        path = self.reports_dir / 'connection_overhead.png'
+        fig.savefig(path, dpi=SAVE_DPI, **PNG_KW)
         print("📊 Generated: connection_overhead.png")
+        return path
     
-    def create_performance_summary(self, postgres_data):
+    def create_performance_summary(self, arrays, fig):
         """Create a comprehensive performance summary chart"""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
-        
-        without_pooling = postgres_data['withoutPooling']
-        with_pooling = postgres_data['withPooling']
+        (ax1, ax2), (ax3, ax4) = self._reset_figure(fig, (16, 12), 2, 2)
         
         # Get common user counts
         common_users = []
@@ -156,82 +269,72 @@ class SimpleChartGenerator:
         latency_without = []
         latency_with = []
         
-        for with_result in with_pooling:
-            user_count = with_result['concurrentUsers']
-            without_result = next((r for r in without_pooling if r['concurrentUsers'] == user_count), None)
+        wo_by_users = {u: k for k, u in enumerate(arrays.users_wo.tolist())}
+        
+        for i, user_count in enumerate(arrays.users_wp.tolist()):
+            j = wo_by_users.get(user_count)
             
-            if without_result:
+            if j is not None:
                 common_users.append(user_count)
-                throughput_without.append(without_result['requests']['average'])
-                throughput_with.append(with_result['requests']['average'])
-                latency_without.append(without_result['latency']['p99'])
-                latency_with.append(with_result['latency']['p99'])
+                throughput_without.append(arrays.rps_wo[j])
+                throughput_with.append(arrays.rps_wp[i])
+                latency_without.append(arrays.p99_wo[j])
+                latency_with.append(arrays.p99_wp[i])
         
         # 1. Throughput comparison
-        x_pos = range(len(common_users))
+        x_pos = np.arange(len(common_users))
         width = 0.35
         
-        ax1.bar([x - width/2 for x in x_pos], throughput_without, width, 
+        ax1.bar(x_pos - width/2, throughput_without, width, 
                 label='Without Pooling', color='#e74c3c', alpha=0.7)
-        ax1.bar([x + width/2 for x in x_pos], throughput_with, width, 
+        ax1.bar(x_pos + width/2, throughput_with, width, 
                 label='With Pooling', color='#2ecc71', alpha=0.7)
         ax1.set_ylabel('Requests/sec')
         ax1.set_title('Throughput Comparison')
-        ax1.set_xticks(x_pos)
-        ax1.set_xticklabels([f'{u}' for u in common_users])
-        ax1.legend()
-        ax1.grid(True, alpha=0.3)
         
         # 2. Latency comparison
-        ax2.bar([x - width/2 for x in x_pos], latency_without, width, 
+        ax2.bar(x_pos - width/2, latency_without, width, 
                 label='Without Pooling', color='#e74c3c', alpha=0.7)
-        ax2.bar([x + width/2 for x in x_pos], latency_with, width, 
+        ax2.bar(x_pos + width/2, latency_with, width, 
                 label='With Pooling', color='#2ecc71', alpha=0.7)
         ax2.set_ylabel('P99 Latency (ms)')
         ax2.set_title('Latency Comparison')
-        ax2.set_xticks(x_pos)
-        ax2.set_xticklabels([f'{u}' for u in common_users])
-        ax2.legend()
-        ax2.grid(True, alpha=0.3)
         
         # 3. Performance improvements
-        improvements = []
-        for i in range(len(common_users)):
-            if throughput_without[i] > 0:
-                improvement = ((throughput_with[i] - throughput_without[i]) / throughput_without[i]) * 100
-                improvements.append(improvement)
-            else:
-                improvements.append(0)
+        tp_without = np.asarray(throughput_without, dtype=float)
+        tp_with = np.asarray(throughput_with, dtype=float)
+        improvements = np.zeros(len(common_users))
+        np.divide((tp_with - tp_without) * 100, tp_without, out=improvements, where=tp_without > 0)
         
         bars = ax3.bar(x_pos, improvements, color='#f39c12', alpha=0.8)
         ax3.set_ylabel('Improvement (%)')
         ax3.set_title('Throughput Improvement with Pooling')
-        ax3.set_xticks(x_pos)
-        ax3.set_xticklabels([f'{u}' for u in common_users])
         ax3.axhline(y=0, color='black', linestyle='-', alpha=0.3)
-        ax3.grid(True, alpha=0.3)
+        
+        user_labels = [f'{u}' for u in common_users]
+        for ax in (ax1, ax2, ax3):
+            ax.set_xticks(x_pos)
+            ax.set_xticklabels(user_labels)
+            ax.grid(True, alpha=0.3)
+        ax1.legend()
+        ax2.legend()
         
         # Add percentage labels
-        for i, (bar, improvement) in enumerate(zip(bars, improvements)):
-            if improvement > 0:
-                ax3.text(bar.get_x() + bar.get_width()/2, bar.get_height() + max(improvements) * 0.02,
-                        f'+{improvement:.0f}%', ha='center', va='bottom', fontweight='bold')
+        labels = [f'+{v:.0f}%' if v > 0 else '' for v in improvements]
+        ax3.bar_label(bars, labels=labels, padding=3, fontweight='bold')
         
         # 4. Summary statistics
         ax4.axis('off')
         
         # Calculate summary stats
-        avg_throughput_improvement = sum(improvements) / len(improvements) if improvements else 0
-        max_throughput_improvement = max(improvements) if improvements else 0
-        
-        avg_latency_reduction = 0
-        if latency_without and latency_with:
-            latency_improvements = []
-            for i in range(len(latency_without)):
-                if latency_without[i] > 0:
-                    reduction = ((latency_without[i] - latency_with[i]) / latency_without[i]) * 100
-                    latency_improvements.append(reduction)
-            avg_latency_reduction = sum(latency_improvements) / len(latency_improvements) if latency_improvements else 0
+        avg_throughput_improvement = improvements.mean() if improvements.size else 0.0
+        max_throughput_improvement = improvements.max() if improvements.size else 0.0
+        
+        lw = np.asarray(latency_without, dtype=float)
+        lp = np.asarray(latency_with, dtype=float)
+        mask = lw > 0
+        latency_improvements = (lw[mask] - lp[mask]) / lw[mask] * 100
+        avg_latency_reduction = latency_improvements.mean() if latency_improvements.size else 0.0
         
         summary_text = f"""
         📊 PERFORMANCE SUMMARY
@@ -254,33 +357,86 @@ class SimpleChartGenerator:
                 verticalalignment='top', fontfamily='monospace',
                 bbox=dict(boxstyle="round,pad=0.5", facecolor='lightblue', alpha=0.7))
         
-        plt.suptitle('Connection Pooling Performance Analysis', fontsize=18, fontweight='bold', y=0.98)
-        plt.tight_layout()
-        plt.savefig(self.reports_dir / 'performance_summary.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.suptitle('Connection Pooling Performance Analysis', fontsize=18, fontweight='bold')
+        path = self.reports_dir / 'performance_summary.png'
+        fig.savefig(path, dpi=SAVE_DPI, **PNG_KW)
         print("📊 Generated: performance_summary.png")
+        return path
     
-    def generate_all_charts(self):
-        """Generate all performance charts"""
+    def generate_all_charts(self, parallel=False):
+        """Generate all performance charts, optionally in forked worker processes"""
         print("🎨 Generating performance charts...")
         
-        results = self.load_latest_results()
+        jobs = []
+        self._written = []
+        
+        # Decide what is stale from stat() calls alone, before parsing any results
+        stale = {}
+        for kind, src in self.find_latest_results().items():
+            for name, chart in CHARTS[kind]:
+                if self._needs_rebuild(self.reports_dir / chart, src):
+                    stale.setdefault(kind, []).append(name)
+                else:
+                    print(f"⏭️  Up to date: {chart}")
         
-        if 'postgres' in results:
+        if not stale:
+            print(f"\n✅ All charts up to date in {self.reports_dir}/")
+            return
+        
+        if 'postgres' in stale:
             print("📊 Creating PostgreSQL performance charts...")
-            self.create_throughput_comparison(results['postgres'])
-            self.create_latency_comparison(results['postgres'])
-            self.create_performance_summary(results['postgres'])
+            arrays = _extract_postgres_arrays(self._load_cached(self._sources['postgres']))
+            jobs.extend((name, arrays) for name in stale['postgres'])
         
-        if 'overhead' in results:
+        if 'overhead' in stale:
             print("📊 Creating connection overhead charts...")
-            self.create_connection_overhead_chart(results['overhead'])
+            overhead = self._load_cached(self._sources['overhead'])
+            jobs.extend((name, overhead) for name in stale['overhead'])
+        
+        # Worker start-up costs more than a chart takes to draw unless processes are forked
+        if parallel and 'fork' not in multiprocessing.get_all_start_methods():
+            print("⚠️  --parallel needs the fork start method, which this platform lacks; rendering serially")
+            parallel = False
+        
+        if parallel and len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=4, mp_context=multiprocessing.get_context('fork'),
+                                     initializer=_init_worker) as executor:
+                futures = [executor.submit(_render_chart, name, data) for name, data in jobs]
+                for future in futures:
+                    self._written.append(future.result())
+        else:
+            # One figure is cleared and reused for every chart
+            fig = plt.figure()
+            for name, data in jobs:
+                self._written.append(getattr(self, name)(data, fig))
+            plt.close(fig)
+        
+        self._write_cache()
         
         print(f"\n✅ All charts generated in {self.reports_dir}/")
         print("📁 Generated files:")
-        for chart_file in self.reports_dir.glob('*.png'):
-            print(f"   - {chart_file.name}")
+        for path in self._written:
+            print(f"   - {path.name}")
+
+_worker_generator = None
+
+def _init_worker():
+    """Build one generator per worker process so the style is applied once, not per chart"""
+    global _worker_generator
+    _worker_generator = SimpleChartGenerator()
+
+def _render_chart(name, data):
+    """Worker-process entry point: render one chart on its own figure and return its path"""
+    fig = plt.figure()
+    path = getattr(_worker_generator, name)(data, fig)
+    plt.close(fig)
+    return path
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Generate connection pooling performance charts')
+    parser.add_argument('--parallel', action='store_true',
+                        help='render charts in forked worker processes (not available on Windows)')
+    args = parser.parse_args()
+    
     generator = SimpleChartGenerator()
-    generator.generate_all_charts()
\ No newline at end of file
+    generator.generate_all_charts(parallel=args.parallel)
\ No newline at end of file